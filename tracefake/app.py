@@ -3,16 +3,21 @@ import numpy as np
 import pandas as pd
 import tensorflow as tf
 import os
+import shutil
+import tempfile
 import streamlit_shadcn_ui as ui
 
 # Removed problematic import: from streamlit_extras.metric_cards import style_metric_cards
 
 from forensics.exif_analysis import extract_exif
 from forensics.ela_analysis import perform_ela
+from forensics.video_analysis import analyze_video
 from utils.image_preprocessing import load_and_preprocess_image
-from utils.visualization import plot_ela_image
+from utils.visualization import plot_ela_image, overlay_heatmap
+from utils.video_processing import VIDEO_EXTENSIONS
 from utils.ui_loader import inject_custom_css
 from ai_explainer.openai_explainer import generate_explanation
+from models.model_utils import build_gradcam_model, predict_with_gradcam
 
 # ----------------- CONFIG & STYLING -----------------
 st.set_page_config(
@@ -39,6 +44,66 @@ def load_model():
 
 model = load_model()
 
+@st.cache_resource
+def load_gradcam_model(_model):
+    return build_gradcam_model(_model) if _model else None
+
+gradcam_model = load_gradcam_model(model)
+
+@st.cache_data(show_spinner=False)
+def predict_with_localization(processed_img):
+    """
+    Runs the CNN once and returns (confidence, Grad-CAM heatmap).
+    Both are cached together, so switching tabs does not rerun the model.
+    """
+    if gradcam_model is not None:
+        prediction, heatmaps = predict_with_gradcam(gradcam_model, processed_img)
+        return float(prediction[0][0]), heatmaps[0]
+    return float(model.predict(processed_img)[0][0]), None
+
+@st.cache_data(show_spinner=False)
+def analyze_uploaded_video(file_id, _uploaded_file, file_ext):
+    """
+    Spools a video upload to disk and runs analyze_video on it.
+    Keyed on the upload's file_id, so reruns (e.g. switching tabs) reuse the result
+    instead of decoding the clip and rerunning ELA / CNN on every keyframe.
+    """
+    # OpenCV can only stream from a real file, so spool the upload to disk in chunks
+    with tempfile.NamedTemporaryFile(suffix=f".{file_ext}", delete=False) as tmp:
+        _uploaded_file.seek(0)
+        shutil.copyfileobj(_uploaded_file, tmp)
+        video_path = tmp.name
+
+    try:
+        return analyze_video(video_path, model=model, gradcam_model=gradcam_model)
+    finally:
+        os.remove(video_path)
+
+def render_verdict(label, conf_percent, is_real):
+    verdict_class = "verdict-real" if is_real else "verdict-fake"
+    verdict_color = "#00cc66" if is_real else "#ff3333"
+    
+    st.markdown(f"""
+    <div class="verdict-box {verdict_class}">
+        <h2 class="verdict-title" style="color: {verdict_color}">{label}</h2>
+        <div class="verdict-conf">CONFIDENCE: {conf_percent*100:.2f}%</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_ai_report(label, conf_percent, exif_data, ela_score):
+    st.markdown('<div class="ai-terminal">', unsafe_allow_html=True)
+    with st.spinner("GENERATING AI FORENSIC REPORT..."):
+        explanation = generate_explanation(
+            label=label,
+            confidence=conf_percent,
+            exif_data=exif_data,
+            ela_score=ela_score
+        )
+        
+        # Simulate typing effect? No, just stream or show. simple markdown for now.
+        st.markdown(f"**SYSTEM OUTPUT:**\n\n{explanation}")
+    st.markdown('</div>', unsafe_allow_html=True)
+
 # ----------------- SIDEBAR -----------------
 with st.sidebar:
     st.markdown("## 🔍 TraceFake System")
@@ -52,6 +117,7 @@ with st.sidebar:
     - 🧠 **CNN Inference** (Deep Learning)
     - 📉 **Error Level Analysis** (Compression Artifacts)
     - 📋 **Metadata Extraction** (EXIF Headers)
+    - 🎞️ **Video / GIF Scanning** (Keyframe Sampling)
     """)
     
     st.markdown("---")
@@ -67,11 +133,94 @@ st.markdown("""
 
 # ----------------- MAIN UPLOAD -----------------
 # Fixed label warning by adding a label
-uploaded_file = st.file_uploader("Initiate Scan", type=["jpg", "jpeg", "png"], label_visibility="collapsed")
+uploaded_file = st.file_uploader("Initiate Scan", type=["jpg", "jpeg", "png"] + VIDEO_EXTENSIONS, label_visibility="collapsed")
+file_ext = os.path.splitext(uploaded_file.name)[1].lstrip('.').lower() if uploaded_file else ""
 
 if not uploaded_file:
     # Placeholder / Empty State
-    st.info("Initiate forensic scan by uploading a target image.")
+    st.info("Initiate forensic scan by uploading a target image, video or GIF.")
+elif file_ext in VIDEO_EXTENSIONS:
+    # ----------------- VIDEO / GIF SCANNING -----------------
+    with st.spinner('SAMPLING KEYFRAMES & RUNNING BATCHED INFERENCE...'):
+        video_result = analyze_uploaded_video(uploaded_file.file_id, uploaded_file, file_ext)
+
+    if not video_result["timeline"]:
+        st.error("Could not decode any frames from this file.")
+        st.stop()
+
+    label = video_result["label"]
+    conf_percent = video_result["confidence"]
+    is_real = video_result["is_real"]
+    ela_score = video_result["ela_score"]
+    timeline_df = pd.DataFrame(video_result["timeline"])
+
+    if not model:
+        # Demo Mode Fallback
+        label = "FAKE"
+        conf_percent = 0.88
+        is_real = False
+
+    col_img, col_metrics = st.columns([1, 1])
+
+    # ----------------- RESULT DASHBOARD -----------------
+    render_verdict(label, conf_percent, is_real)
+
+    with col_img:
+        st.markdown("### TARGET MEDIA")
+        if file_ext == "gif":
+            st.image(uploaded_file, width="stretch")
+        else:
+            st.video(uploaded_file)
+
+    with col_metrics:
+        st.markdown("### TELEMETRY")
+        
+        c1, c2 = st.columns(2)
+        c1.metric(label="Model Confidence", value=f"{conf_percent:.2%}", delta="High Integrity" if is_real else "-Suspicious")
+        c2.metric(label="ELA Noise Level", value=f"{ela_score:.1f}", delta="Normal" if ela_score < 10 else "High variance", delta_color="inverse")
+
+        c3, c4 = st.columns(2)
+        c3.metric(label="Keyframes Analyzed", value=f"{video_result['frames_sampled']} / {video_result['frames_total']}")
+        fake_ratio = video_result["fake_ratio"]
+        c4.metric(label="Flagged Keyframes", value="N/A" if fake_ratio is None else f"{fake_ratio:.0%}")
+
+    # ----------------- FORENSICS TABS -----------------
+    st.markdown("---")
+    st.markdown("## 🕵️ FORENSIC DEEP DIVE")
+    
+    active_tab = ui.tabs(options=['Frame Timeline', 'Error Level Analysis'], default_value='Frame Timeline', key="video_forensic_tabs")
+    
+    if active_tab == 'Frame Timeline':
+        with st.container():
+            st.markdown('<div class="forensic-panel">', unsafe_allow_html=True)
+            score_columns = ["Real Score", "ELA Score"] if model else ["ELA Score"]
+            st.line_chart(timeline_df.set_index("Time (s)")[score_columns])
+            st.dataframe(timeline_df, width="stretch", hide_index=True)
+            st.markdown("""
+            > **Timeline Guide:**
+            > *   **Real Score**: CNN probability of an authentic frame. Dips below 0.5 mark suspicious segments.
+            > *   **ELA Score**: Spikes suggest frames that were re-encoded or spliced differently.
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    elif active_tab == 'Error Level Analysis':
+        with st.container():
+            st.markdown('<div class="forensic-panel">', unsafe_allow_html=True)
+            col_ela_1, col_ela_2, col_ela_3 = st.columns(3)
+            with col_ela_1:
+                st.image(video_result["suspect_frame"], caption="Most Suspicious Keyframe", width="stretch")
+            with col_ela_2:
+                st.image(video_result["suspect_ela"], caption="ELA Map", width="stretch")
+            with col_ela_3:
+                if video_result["suspect_heatmap"] is not None:
+                    st.image(overlay_heatmap(video_result["suspect_frame"], video_result["suspect_heatmap"]),
+                             caption="Grad-CAM Localization", width="stretch")
+                else:
+                    st.info("Grad-CAM requires a trained model.")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    # ----------------- AI EXPLAINER -----------------
+    render_ai_report(label, conf_percent, {}, ela_score)
 else:
     # ----------------- SCANNING & PROCESSING -----------------
     import io
@@ -89,12 +238,12 @@ else:
         ela_score = 0
         exif_data = {}
         ela_result = None
+        heatmap = None
         is_real = False
 
         # --- PREDICTION ---
         if model:
-            prediction = model.predict(processed_img)
-            confidence = prediction[0][0]
+            confidence, heatmap = predict_with_localization(processed_img)
             is_real = confidence > 0.5
             label = "REAL" if is_real else "FAKE"
             conf_percent = confidence if is_real else (1 - confidence)
@@ -107,15 +256,7 @@ else:
     # ----------------- RESULT DASHBOARD -----------------
     
     # 1. Verdict Banner
-    verdict_class = "verdict-real" if is_real else "verdict-fake"
-    verdict_color = "#00cc66" if is_real else "#ff3333"
-    
-    st.markdown(f"""
-    <div class="verdict-box {verdict_class}">
-        <h2 class="verdict-title" style="color: {verdict_color}">{label}</h2>
-        <div class="verdict-conf">CONFIDENCE: {conf_percent*100:.2f}%</div>
-    </div>
-    """, unsafe_allow_html=True)
+    render_verdict(label, conf_percent, is_real)
 
     # 2. Detail Columns
     with col_img:
@@ -170,31 +311,24 @@ else:
     elif active_tab == 'Error Level Analysis':
         with st.container():
             st.markdown('<div class="forensic-panel">', unsafe_allow_html=True)
-            col_ela_1, col_ela_2 = st.columns(2)
+            col_ela_1, col_ela_2, col_ela_3 = st.columns(3)
             with col_ela_1:
                 st.image(rgb_img, caption="Original RGB", width="stretch")
             with col_ela_2:
                 # ELA Result was calculated above
                 st.image(ela_result, caption="ELA Map", use_container_width=True)
+            with col_ela_3:
+                if heatmap is not None:
+                    st.image(overlay_heatmap(rgb_img, heatmap), caption="Grad-CAM Localization", width="stretch")
+                else:
+                    st.info("Grad-CAM requires a trained model.")
             st.markdown("""
             > **Analysis Guide:**
             > *   **Uniform Black**: Original, high quality.
             > *   **White/Bright Spots**: Potential edits or different compression levels (splices).
+            > *   **Grad-CAM Hot Zones**: Regions that pushed the CNN towards a FAKE verdict.
             """)
             st.markdown('</div>', unsafe_allow_html=True)
 
     # ----------------- AI EXPLAINER -----------------
-    
-    st.markdown('<div class="ai-terminal">', unsafe_allow_html=True)
-    with st.spinner("GENERATING AI FORENSIC REPORT..."):
-        explanation = generate_explanation(
-            label=label,
-            confidence=conf_percent,
-            exif_data=exif_data,
-            ela_score=ela_score
-        )
-        import time
-        
-        # Simulate typing effect? No, just stream or show. simple markdown for now.
-        st.markdown(f"**SYSTEM OUTPUT:**\n\n{explanation}")
-    st.markdown('</div>', unsafe_allow_html=True)
+    render_ai_report(label, conf_percent, exif_data, ela_score)
@@ -8,7 +8,7 @@ def perform_ela(image_file, quality=90):
     Performs Error Level Analysis (ELA) on an image.
     
     Args:
-        image_file: File path or file-like object (bytes).
+        image_file: File path, file-like object (bytes) or RGB numpy array (e.g. a video frame).
         quality: Quality level for the re-saved JPEG (default 90).
         
     Returns:
@@ -16,7 +16,9 @@ def perform_ela(image_file, quality=90):
     """
     try:
         # Load image with PIL
-        if hasattr(image_file, 'read'):
+        if isinstance(image_file, np.ndarray):
+            original = Image.fromarray(image_file).convert('RGB')
+        elif hasattr(image_file, 'read'):
             image_file.seek(0)
             original = Image.open(image_file).convert('RGB')
             image_file.seek(0)
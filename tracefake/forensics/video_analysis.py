@@ -0,0 +1,137 @@
+from itertools import islice
+
+import numpy as np
+
+from models.model_utils import predict_with_gradcam
+from forensics.ela_analysis import perform_ela
+from utils.image_preprocessing import preprocess_frames
+from utils.video_processing import iter_frames, get_video_info, sample_keyframes
+
+def aggregate_verdict(real_scores, fake_ratio_threshold=0.3):
+    """
+    Turns per-keyframe CNN scores into a clip-level verdict.
+    Confidence is always the mean score of the dominant class, measured only on the keyframes
+    that agree with the verdict (real score for REAL frames, 1 - real score for FAKE frames).
+
+    Args:
+        real_scores: Sequence of CNN probabilities of the 'Real' class, one per keyframe.
+        fake_ratio_threshold: Share of FAKE keyframes at or above which the whole clip is flagged.
+
+    Returns:
+        dict with label, confidence, is_real and fake_ratio.
+    """
+    real_scores = np.asarray(real_scores, dtype=np.float32)
+    fake_mask = real_scores <= 0.5
+    fake_ratio = float(np.mean(fake_mask))
+    is_real = fake_ratio < fake_ratio_threshold
+
+    supporting = real_scores[~fake_mask] if is_real else 1 - real_scores[fake_mask]
+    return {
+        "label": "REAL" if is_real else "FAKE",
+        "confidence": float(np.mean(supporting)) if supporting.size else 0.0,
+        "is_real": is_real,
+        "fake_ratio": fake_ratio,
+    }
+
+def analyze_video(video_path, model=None, gradcam_model=None, batch_size=16, diff_threshold=8.0, max_gap=30,
+                  max_frames=64, fake_ratio_threshold=0.3):
+    """
+    Runs the forensic pipeline over a video or animated image.
+    Frames are streamed from disk, near-duplicates are skipped by the keyframe sampler,
+    and the remaining frames go through the CNN in batches plus a per-frame ELA pass.
+
+    Args:
+        video_path: Path to the video / GIF on disk.
+        model: Loaded Keras model, or None (ELA-only / demo mode).
+        gradcam_model: (backbone, head) from build_gradcam_model, or None to skip localization.
+                       Pass a cached one - it is not rebuilt here.
+        batch_size: Number of keyframes sent through the CNN (and Grad-CAM) at once.
+        diff_threshold, max_gap: Passed to sample_keyframes().
+        max_frames: Keyframe budget. It is spread over the whole clip by raising
+                    the sampler's min_gap, so late segments are analyzed too. When the container
+                    does not report a frame count, it becomes a hard cap on kept keyframes instead.
+        fake_ratio_threshold: Share of FAKE keyframes at or above which the whole clip is flagged.
+                              Deepfakes often only tamper a segment, so a plain mean would dilute them.
+
+    Returns:
+        dict with:
+            timeline: List of per-keyframe dicts (Frame, Time (s), Real Score, ELA Score).
+            heatmaps: Grad-CAM heatmap per keyframe, aligned with timeline (None entries without Grad-CAM).
+            frames_total, frames_sampled: Frame counts before / after sampling.
+            fps: Frame rate used for the timestamps.
+            label, confidence, is_real: Aggregate verdict from aggregate_verdict() (label is "UNKNOWN" without a model).
+            fake_ratio: Share of keyframes the CNN classified as FAKE (None without a model).
+            ela_score: Mean ELA noise level across keyframes.
+            suspect_frame, suspect_ela: The most suspicious keyframe and its ELA map (or None).
+            suspect_heatmap: Grad-CAM heatmap of that keyframe (None without a model).
+    """
+    fps, frames_total = get_video_info(video_path)
+
+    # Spread the budget over the whole clip instead of stopping after the first N keyframes.
+    # Ceiling division: keyframes at least ceil(total / max_frames) apart never exceed max_frames.
+    min_gap = max(1, -(-frames_total // max_frames)) if frames_total else 1
+    max_gap = max(max_gap, min_gap)
+    keyframes = sample_keyframes(iter_frames(video_path), diff_threshold=diff_threshold,
+                                 min_gap=min_gap, max_gap=max_gap)
+    if not frames_total:
+        # Unknown length (e.g. browser-recorded WebM): the budget cannot be spread, so cap it
+        keyframes = islice(keyframes, max_frames)
+
+    timeline = []
+    heatmaps_out = []
+    suspect = {"score": None, "frame": None, "ela": None, "heatmap": None}
+    pending = []
+
+    def flush(batch):
+        # One forward (+ one Grad-CAM gradient) pass per batch instead of per frame
+        heatmaps = [None] * len(batch)
+        if gradcam_model is not None:
+            scores, heatmaps = predict_with_gradcam(gradcam_model, preprocess_frames([frame for _, frame, _ in batch]))
+            scores = scores[:, 0]
+        elif model is not None:
+            scores = model.predict(preprocess_frames([frame for _, frame, _ in batch]), verbose=0)[:, 0]
+        else:
+            scores = [None] * len(batch)
+
+        for (index, frame, ela_result), score, heatmap in zip(batch, scores, heatmaps):
+            ela_score = float(np.mean(ela_result))
+            timeline.append({
+                "Frame": index,
+                "Time (s)": round(index / fps, 2),
+                "Real Score": None if score is None else float(score),
+                "ELA Score": ela_score,
+            })
+            heatmaps_out.append(heatmap)
+            # Lowest real score wins; without a model fall back to the noisiest ELA frame
+            rank = -ela_score if score is None else float(score)
+            if suspect["score"] is None or rank < suspect["score"]:
+                suspect.update(score=rank, frame=frame, ela=ela_result, heatmap=heatmap)
+
+    for index, frame in keyframes:
+        pending.append((index, frame, perform_ela(frame)))
+        if len(pending) >= batch_size:
+            flush(pending)
+            pending = []
+    if pending:
+        flush(pending)
+
+    result = {
+        "timeline": timeline,
+        "heatmaps": heatmaps_out,
+        "frames_total": max(frames_total, timeline[-1]["Frame"] + 1 if timeline else 0),
+        "frames_sampled": len(timeline),
+        "fps": fps,
+        "label": "UNKNOWN",
+        "confidence": 0.0,
+        "is_real": False,
+        "fake_ratio": None,
+        "ela_score": float(np.mean([t["ELA Score"] for t in timeline])) if timeline else 0.0,
+        "suspect_frame": suspect["frame"],
+        "suspect_ela": suspect["ela"],
+        "suspect_heatmap": suspect["heatmap"],
+    }
+
+    if model is not None and timeline:
+        result.update(aggregate_verdict([t["Real Score"] for t in timeline], fake_ratio_threshold))
+
+    return result
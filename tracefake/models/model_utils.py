@@ -54,3 +54,68 @@ def load_trained_model(model_path):
     except Exception as e:
         print(f"Failed to load model from {model_path}: {e}")
         return None
+
+# Output of the last EfficientNetB0 conv block (top_conv -> top_bn -> swish)
+GRADCAM_LAYER = 'top_activation'
+
+def build_gradcam_model(model, layer_name=GRADCAM_LAYER):
+    """
+    Splits a model built by build_model at the final conv activation, so Grad-CAM
+    can reuse the prediction's forward activations and only differentiate the head.
+
+    Args:
+        model: Keras model from build_model / load_trained_model.
+        layer_name: Conv layer to localize on (default: final EfficientNetB0 activation).
+
+    Returns:
+        gradcam_model: Tuple (backbone, head) where backbone maps images to conv activations
+                       and head maps conv activations to predictions, or None if the split fails.
+    """
+    try:
+        conv_layer = model.get_layer(layer_name)
+        backbone = Model(inputs=model.inputs, outputs=conv_layer.output)
+
+        # Layers after the conv layer form a plain chain in build_model (pooling -> dense -> dense)
+        head_input = tf.keras.Input(shape=conv_layer.output.shape[1:])
+        x = head_input
+        for layer in model.layers[model.layers.index(conv_layer) + 1:]:
+            x = layer(x)
+        head = Model(inputs=head_input, outputs=x)
+
+        return backbone, head
+    except Exception as e:
+        print(f"Grad-CAM unavailable, could not split model at '{layer_name}': {e}")
+        return None
+
+def predict_with_gradcam(gradcam_model, batch):
+    """
+    Runs prediction and Grad-CAM for a whole batch in one forward + one gradient pass.
+    The backbone runs outside the gradient tape, so its activations are not kept for backprop.
+    Only the head (pooling + dense layers) is recorded, which keeps the extra time and memory
+    small compared to the prediction itself.
+
+    Args:
+        gradcam_model: Tuple (backbone, head) from build_gradcam_model.
+        batch: Preprocessed images of shape (N, height, width, 3).
+
+    Returns:
+        predictions: Numpy array of shape (N, 1), same as model.predict.
+        heatmaps: Numpy array of shape (N, h, w) in [0, 1] at conv resolution (7x7 for 224 input).
+                  Bright regions are the ones pushing the model towards FAKE.
+    """
+    backbone, head = gradcam_model
+    conv_outputs = backbone(tf.convert_to_tensor(batch, dtype=tf.float32), training=False)
+
+    with tf.GradientTape() as tape:
+        tape.watch(conv_outputs)
+        predictions = head(conv_outputs, training=False)
+        # Model outputs probability of class 1 (real); explain the FAKE score.
+        # Samples are independent, so the gradient of the sum gives per-sample gradients.
+        fake_score = tf.reduce_sum(1.0 - predictions)
+
+    grads = tape.gradient(fake_score, conv_outputs)
+    channel_weights = tf.reduce_mean(grads, axis=(1, 2), keepdims=True)
+    heatmaps = tf.nn.relu(tf.reduce_sum(channel_weights * conv_outputs, axis=-1))
+    heatmaps = tf.math.divide_no_nan(heatmaps, tf.reduce_max(heatmaps, axis=(1, 2), keepdims=True))
+
+    return predictions.numpy(), heatmaps.numpy()
@@ -0,0 +1,23 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+# Modules import each other as top-level packages (e.g. `from utils...`), like app.py does
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+def make_frames(values, size=(32, 32)):
+    """Solid-color RGB frames, one per gray value, as (index, frame) pairs."""
+    return [(i, np.full(size + (3,), v, dtype=np.uint8)) for i, v in enumerate(values)]
+
+@pytest.fixture
+def make_gif(tmp_path):
+    """Writes an animated GIF with one solid frame per gray value and returns its path."""
+    def _make_gif(values, duration=100, size=(32, 32)):
+        path = str(tmp_path / "clip.gif")
+        frames = [Image.new('RGB', size, (v, v, v)) for v in values]
+        frames[0].save(path, save_all=True, append_images=frames[1:], duration=duration, loop=0)
+        return path
+    return _make_gif
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from tensorflow.keras.layers import Activation, Conv2D, Dense, GlobalAveragePooling2D, Input
+from tensorflow.keras.models import Model
+
+from models.model_utils import build_gradcam_model, predict_with_gradcam
+
+def tiny_model():
+    """Same head as build_model on a small conv stack ending in a 'top_activation' layer."""
+    inputs = Input(shape=(32, 32, 3))
+    x = Conv2D(8, 3, strides=4, padding='same')(inputs)
+    x = Activation('swish', name='top_activation')(x)
+    x = GlobalAveragePooling2D()(x)
+    x = Dense(16, activation='relu')(x)
+    return Model(inputs=inputs, outputs=Dense(1, activation='sigmoid')(x))
+
+def test_predict_with_gradcam_matches_predict():
+    model = tiny_model()
+    batch = np.random.RandomState(0).uniform(0, 255, (3, 32, 32, 3)).astype(np.float32)
+
+    predictions, heatmaps = predict_with_gradcam(build_gradcam_model(model), batch)
+
+    np.testing.assert_allclose(predictions, model.predict(batch, verbose=0), atol=1e-5)
+    assert heatmaps.shape == (3, 8, 8)
+    assert heatmaps.min() >= 0.0
+    assert heatmaps.max() <= 1.0
+
+def test_build_gradcam_model_missing_layer():
+    inputs = Input(shape=(4,))
+    model = Model(inputs=inputs, outputs=Dense(1)(inputs))
+    assert build_gradcam_model(model) is None
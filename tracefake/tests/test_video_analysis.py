@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from forensics import video_analysis
+from forensics.video_analysis import aggregate_verdict, analyze_video
+from utils.image_preprocessing import preprocess_frames
+
+class StubModel:
+    """Scores each frame by its brightness: bright frames look REAL, dark frames FAKE."""
+    def predict(self, batch, verbose=0):
+        self.batch_sizes = getattr(self, 'batch_sizes', []) + [len(batch)]
+        return np.mean(batch, axis=(1, 2, 3)).reshape(-1, 1) / 255.0
+
+def test_aggregate_verdict_real_uses_real_frames_only():
+    # 29% of frames near 0.0 stay under the threshold; confidence must not be dragged below 0.5
+    verdict = aggregate_verdict([0.0] * 29 + [0.6] * 71, fake_ratio_threshold=0.3)
+    assert verdict["label"] == "REAL"
+    assert verdict["confidence"] == pytest.approx(0.6)
+    assert verdict["fake_ratio"] == pytest.approx(0.29)
+
+def test_aggregate_verdict_fake_uses_fake_frames_only():
+    verdict = aggregate_verdict([0.1, 0.3, 0.9, 0.9], fake_ratio_threshold=0.3)
+    assert verdict["label"] == "FAKE"
+    assert not verdict["is_real"]
+    assert verdict["confidence"] == pytest.approx(0.8)
+
+def test_preprocess_frames_batches_frames():
+    frames = [np.zeros((48, 64, 3), dtype=np.uint8), np.full((10, 20, 3), 255, dtype=np.uint8)]
+    assert preprocess_frames(frames).shape == (2, 224, 224, 3)
+
+def test_analyze_video_without_model(make_gif):
+    result = analyze_video(make_gif([0, 255, 0]))
+    assert result["label"] == "UNKNOWN"
+    assert result["fake_ratio"] is None
+    assert [t["Frame"] for t in result["timeline"]] == [0, 1, 2]
+    assert all(t["Real Score"] is None for t in result["timeline"])
+    assert result["heatmaps"] == [None, None, None]
+
+def test_analyze_video_spreads_budget_over_clip(make_gif):
+    model = StubModel()
+    # 190 frames does not divide evenly by the budget
+    result = analyze_video(make_gif([40, 220] * 95), model=model, max_frames=10, batch_size=4)
+
+    frames = [t["Frame"] for t in result["timeline"]]
+    assert result["frames_total"] == 190
+    assert len(frames) <= 10
+    assert frames[-1] >= 190 - 2 * 19
+    assert max(model.batch_sizes) <= 4
+
+@pytest.mark.parametrize("frames_total", [65, 100, 127, 1000])
+def test_analyze_video_never_exceeds_budget(make_gif, monkeypatch, frames_total):
+    # Constant motion: every frame would be a keyframe without the budget
+    monkeypatch.setattr(video_analysis, "get_video_info", lambda path: (30.0, frames_total))
+    result = analyze_video(make_gif([40, 220] * (frames_total // 2) + [40] * (frames_total % 2)),
+                           max_frames=64)
+
+    assert result["frames_sampled"] <= 64
+
+def test_analyze_video_caps_budget_without_frame_count(make_gif, monkeypatch):
+    monkeypatch.setattr(video_analysis, "get_video_info", lambda path: (10.0, 0))
+    result = analyze_video(make_gif([40, 220] * 50), model=StubModel(), max_frames=10)
+
+    assert result["frames_sampled"] <= 10
+
+def test_analyze_video_flags_fake_segment(make_gif):
+    # Bright (REAL) start, dark (FAKE) tail - the tail must show up in the verdict
+    values = [230, 240] * 30 + [10, 20] * 30
+    result = analyze_video(make_gif(values), model=StubModel(), max_frames=20)
+
+    assert result["label"] == "FAKE"
+    assert result["fake_ratio"] >= 0.3
+    assert result["timeline"][-1]["Frame"] >= 100
+    assert result["suspect_frame"].mean() < 50
+
+def test_analyze_video_exports_heatmap_per_keyframe(make_gif, monkeypatch):
+    calls = []
+
+    def stub_predict_with_gradcam(gradcam_model, batch):
+        # Heatmap value encodes the position inside the batch
+        calls.append(len(batch))
+        heatmaps = np.stack([np.full((7, 7), i, dtype=np.float32) for i in range(len(batch))])
+        return StubModel().predict(batch), heatmaps
+
+    monkeypatch.setattr(video_analysis, "predict_with_gradcam", stub_predict_with_gradcam)
+    result = analyze_video(make_gif([10, 240, 10, 240]), model=StubModel(), gradcam_model=object(), batch_size=2)
+
+    assert calls == [2, 2]
+    assert len(result["heatmaps"]) == len(result["timeline"]) == 4
+    assert [h[0, 0] for h in result["heatmaps"]] == [0, 1, 0, 1]
+    assert result["suspect_heatmap"] is result["heatmaps"][0]
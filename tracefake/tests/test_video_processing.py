@@ -0,0 +1,67 @@
+import cv2
+
+from conftest import make_frames
+from utils import video_processing
+from utils.video_processing import iter_frames, get_video_info, sample_keyframes
+
+def kept_indices(frames, **kwargs):
+    return [index for index, _ in sample_keyframes(frames, **kwargs)]
+
+def test_sample_keyframes_skips_duplicates():
+    assert kept_indices(make_frames([0] * 10)) == [0]
+
+def test_sample_keyframes_keeps_new_content():
+    assert kept_indices(make_frames([0, 255] * 5)) == list(range(10))
+
+def test_sample_keyframes_forces_keyframe_every_max_gap():
+    assert kept_indices(make_frames([0] * 10), max_gap=4) == [0, 4, 8]
+
+def test_sample_keyframes_respects_min_gap():
+    assert kept_indices(make_frames([0, 255] * 5), min_gap=3) == [0, 3, 6, 9]
+
+def test_sample_keyframes_covers_whole_clip():
+    # No hard cap: a long clip with constant motion is sampled to the end
+    indices = kept_indices(make_frames([0, 255] * 150))
+    assert len(indices) == 300
+    assert indices[-1] == 299
+
+def test_iter_frames_reads_gif(make_gif):
+    frames = list(iter_frames(make_gif([0, 128, 255])))
+    assert [index for index, _ in frames] == [0, 1, 2]
+    assert frames[0][1].shape == (32, 32, 3)
+
+class ClosedCapture:
+    """Stands in for an OpenCV build without a GIF decoder."""
+    def __init__(self, path):
+        pass
+
+    def isOpened(self):
+        return False
+
+    def release(self):
+        pass
+
+def test_iter_frames_falls_back_to_pil(make_gif, monkeypatch):
+    path = make_gif([0, 128, 255])
+    monkeypatch.setattr(video_processing.cv2, "VideoCapture", ClosedCapture)
+
+    frames = list(iter_frames(path))
+    assert [index for index, _ in frames] == [0, 1, 2]
+    assert frames[1][1][0, 0].tolist() == [128, 128, 128]
+
+def test_get_video_info_falls_back_to_pil(make_gif, monkeypatch):
+    path = make_gif([0, 128, 255, 64], duration=50)
+    monkeypatch.setattr(video_processing.cv2, "VideoCapture", ClosedCapture)
+
+    assert get_video_info(path) == (20.0, 4)
+
+def test_get_video_info_unreadable_file(tmp_path):
+    path = tmp_path / "broken.mp4"
+    path.write_bytes(b"not a video")
+
+    assert get_video_info(str(path)) == (1.0, 0)
+
+def test_get_video_info_reads_gif(make_gif):
+    fps, frame_count = get_video_info(make_gif([0, 128, 255]))
+    assert fps > 0
+    assert frame_count == 3
@@ -43,3 +43,18 @@ def load_and_preprocess_image(image_file, target_size=(224, 224)):
     preprocessed_image = efficientnet_preprocess(image_batch)
 
     return preprocessed_image, image_rgb
+
+def preprocess_frames(frames, target_size=(224, 224)):
+    """
+    Batch version of load_and_preprocess_image for already decoded frames (e.g. video keyframes).
+
+    Args:
+        frames: List of RGB numpy arrays.
+        target_size: Tuple (height, width).
+
+    Returns:
+        preprocessed_batch: A numpy array of shape (N, height, width, 3) ready for inference.
+    """
+    resized = [cv2.resize(frame, target_size) for frame in frames]
+    image_batch = np.stack(resized, axis=0)
+    return efficientnet_preprocess(image_batch)
@@ -0,0 +1,102 @@
+import cv2
+import numpy as np
+from PIL import Image, ImageSequence
+
+# Extensions routed to the frame-by-frame pipeline instead of the still-image one
+VIDEO_EXTENSIONS = ["mp4", "mov", "avi", "mkv", "webm", "gif"]
+
+def iter_frames(video_path):
+    """
+    Streams frames from a video or animated image one at a time.
+    Only the current frame is held in memory, so long clips are safe to scan.
+
+    Args:
+        video_path: Path to the video / GIF on disk (OpenCV needs a real file).
+
+    Yields:
+        (index, frame_rgb): Frame number and the frame as an RGB numpy array.
+    """
+    cap = cv2.VideoCapture(video_path)
+    index = 0
+    try:
+        while cap.isOpened():
+            ok, frame = cap.read()
+            if not ok:
+                break
+            yield index, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            index += 1
+    finally:
+        cap.release()
+
+    if index > 0:
+        return
+
+    # Some OpenCV builds ship without a GIF decoder - fall back to PIL,
+    # which also decodes lazily frame by frame.
+    try:
+        with Image.open(video_path) as image:
+            for index, frame in enumerate(ImageSequence.Iterator(image)):
+                yield index, np.array(frame.convert('RGB'))
+    except Exception as e:
+        print(f"Error reading frames from {video_path}: {e}")
+
+def get_video_info(video_path):
+    """
+    Reads the frame rate and frame count without decoding the stream.
+
+    Returns:
+        (fps, frame_count): fps falls back to 1.0 when the container does not report it,
+                            frame_count is 0 when unknown.
+    """
+    cap = cv2.VideoCapture(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS) if cap.isOpened() else 0
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) if cap.isOpened() else 0
+    cap.release()
+
+    if not fps or fps <= 0 or not frame_count:
+        # GIF fallback: PIL exposes per-frame duration in milliseconds
+        try:
+            with Image.open(video_path) as image:
+                frame_count = frame_count or getattr(image, 'n_frames', 1)
+                duration = image.info.get('duration', 0)
+                if (not fps or fps <= 0) and duration:
+                    fps = 1000.0 / duration
+        except Exception:
+            pass
+
+    if not fps or fps <= 0:
+        fps = 1.0
+    return fps, max(frame_count, 0)
+
+def sample_keyframes(frames, diff_threshold=8.0, min_gap=1, max_gap=30, thumb_size=(64, 64)):
+    """
+    Adaptive keyframe sampler. Drops frames that are near-identical to the last kept one
+    using the mean absolute difference of tiny grayscale thumbnails (cheap compared to CNN inference).
+
+    Args:
+        frames: Iterable of (index, frame_rgb), e.g. from iter_frames().
+        diff_threshold: Mean pixel difference (0-255) above which a frame counts as new content.
+        min_gap: Never keep two frames closer than `min_gap` frames apart (spreads a frame budget over the clip).
+        max_gap: Keep a frame at least every `max_gap` frames even on static footage.
+        thumb_size: Size of the thumbnail used for differencing.
+
+    Yields:
+        (index, frame_rgb) for every sampled keyframe.
+    """
+    last_thumb = None
+    last_index = None
+
+    for index, frame in frames:
+        if last_index is not None and index - last_index < min_gap:
+            continue
+
+        thumb = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY), thumb_size, interpolation=cv2.INTER_AREA)
+
+        if last_thumb is not None and index - last_index < max_gap:
+            diff = np.mean(cv2.absdiff(thumb, last_thumb))
+            if diff < diff_threshold:
+                continue
+
+        last_thumb = thumb
+        last_index = index
+        yield index, frame
@@ -1,3 +1,5 @@
+import cv2
+import numpy as np
 import matplotlib.pyplot as plt
 import io
 
@@ -19,6 +21,17 @@ def plot_ela_image(original, ela_image):
     plt.tight_layout()
     return fig
 
+def overlay_heatmap(image_rgb, heatmap, alpha=0.4):
+    """
+    Blends a Grad-CAM heatmap (values in [0, 1], any resolution) over an RGB image.
+    Returns an RGB numpy array the size of the original image.
+    """
+    height, width = image_rgb.shape[:2]
+    heatmap = cv2.resize(heatmap.astype(np.float32), (width, height))
+    colored = cv2.applyColorMap(np.uint8(255 * heatmap), cv2.COLORMAP_JET)
+    colored = cv2.cvtColor(colored, cv2.COLOR_BGR2RGB)
+    return cv2.addWeighted(image_rgb.astype(np.uint8), 1 - alpha, colored, alpha, 0)
+
 def create_gauge_chart(confidence):
     """
     Placeholder for a more advanced visualization if needed.